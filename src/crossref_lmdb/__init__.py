@@ -1,9 +1,18 @@
-import crossref_lmdb.log
+import typing
 
-from crossref_lmdb.db import DBReader
-
-crossref_lmdb.log.setup_logging()
+if typing.TYPE_CHECKING:
+    from crossref_lmdb.db import DBReader
 
 __all__ = ("DBReader",)
 __version__ = "0.1.2"
 _project_url = "https://github.com/unimelbmdap/crossref-lmdb"
+
+
+def __getattr__(name: str) -> object:
+    # deferred (PEP 562) so that importing the package doesn't pull in lmdb
+    if name == "DBReader":
+        from crossref_lmdb.db import DBReader
+
+        return DBReader
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
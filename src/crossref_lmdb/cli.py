@@ -5,13 +5,18 @@ Handles the command-line interface (CLI).
 from __future__ import annotations
 
 import argparse
-import pathlib
+import functools
 import logging
 import sys
 import os
 
-import crossref_lmdb.params
-import crossref_lmdb.main
+import typing
+
+import crossref_lmdb
+import crossref_lmdb.log
+
+if typing.TYPE_CHECKING:
+    import crossref_lmdb.params
 
 
 LOGGER = logging.getLogger("crossref-lmdb")
@@ -19,7 +24,14 @@ LOGGER = logging.getLogger("crossref-lmdb")
 
 def main() -> None:
 
-    parser = setup_parser()
+    if "--version" in sys.argv[1:]:
+        # fast path: no need to build the parser just to print the version
+        print(crossref_lmdb.__version__)
+        sys.exit(0)
+
+    crossref_lmdb.log.setup_logging()
+
+    parser = setup_parser(command=get_command_from_argv(argv=sys.argv[1:]))
 
     parsed_args = parser.parse_args()
 
@@ -32,13 +44,33 @@ def main() -> None:
         sys.exit(1)
 
 
-def setup_parser() -> argparse.ArgumentParser:
+def get_command_from_argv(argv: list[str]) -> str | None:
+    """
+    Identify the subcommand (the first non-flag token) in the arguments, if
+    present.
+    """
+
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+
+    return None
+
+
+@functools.cache
+def setup_parser(command: str | None = None) -> argparse.ArgumentParser:
 
     parser = argparse.ArgumentParser(
         description="Interact with Crossref data via a Lightning database.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
 
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=crossref_lmdb.__version__,
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -60,29 +92,51 @@ def setup_parser() -> argparse.ArgumentParser:
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
 
-    create_parser.add_argument(
-        "--public-data-dir",
-        type=pathlib.Path,
-        required=True,
-        help="Path to the Crossref public data directory.",
-    )
+    # only flesh out the arguments of the subparser that is actually being
+    # invoked; the others just need to be listed in the top-level help
+    build_create = command is None or command == "create"
+    build_update = command is None or command == "update"
 
-    create_parser.add_argument(
-        "--db-dir",
-        type=pathlib.Path,
-        required=True,
-        help="Path to the directory to write the database files.",
-    )
+    if build_create:
+
+        create_parser.add_argument(
+            "--public-data-dir",
+            required=True,
+            help="Path to the Crossref public data directory.",
+        )
+
+        create_parser.add_argument(
+            "--db-dir",
+            required=True,
+            help="Path to the directory to write the database files.",
+        )
+
+        create_parser.add_argument(
+            "--start-from-file-num",
+            type=int,
+            required=False,
+            default=0,
+            help="Begin processing from this file number in the public data archive.",
+        )
 
-    create_parser.add_argument(
-        "--start-from-file-num",
-        type=int,
-        required=False,
-        default=0,
-        help="Begin processing from this file number in the public data archive.",
+        create_parser.add_argument(
+            "--sorted",
+            dest="assume_sorted",
+            action="store_true",
+            default=False,
+            help=(
+                "Treat the DOIs in the public data as globally sorted and use "
+                + "LMDB's append mode when inserting. This is much faster, but "
+                + "the load will fail if the DOIs are in fact out of order."
+            ),
+        )
+
+    subparsers_to_build = (
+        ([create_parser] if build_create else [])
+        + ([update_parser] if build_update else [])
     )
 
-    for subparser in (create_parser, update_parser):
+    for subparser in subparsers_to_build:
 
         subparser.add_argument(
             "--commit-frequency",
@@ -102,15 +156,17 @@ def setup_parser() -> argparse.ArgumentParser:
             choices=list(range(-1, 10)),
             default=-1,
             help=(
-                "Level of compression to use for metadata; 0 is no compression, -1 is "
-                + "the default level of compression (6), and between 1 and 9 is the "
-                + "level where 1 is the least and 9 is the most."
+                "Level of compression to use for metadata; 0 is no compression and "
+                + "-1 is the backend's default level. With the `zstd` extra "
+                + "installed the levels are zstd levels (default 3); otherwise they "
+                + "are zlib levels, where 1 is the least and 9 the most compression "
+                + "(default 6), and with the `speed` extra levels above 3 are "
+                + "clamped to isal's maximum of 3."
             ),
         )
 
         subparser.add_argument(
             "--filter-path",
-            type=pathlib.Path,
             required=False,
             help=(
                 "Path to a Python module file containing a function for filtering "
@@ -144,37 +200,38 @@ def setup_parser() -> argparse.ArgumentParser:
             ),
         )
 
-    update_parser.add_argument(
-        "--db-dir",
-        type=pathlib.Path,
-        required=True,
-        help="Path to the directory containing the LMDB database files.",
-    )
+    if build_update:
 
-    update_parser.add_argument(
-        "--email-address",
-        type=str,
-        required=True,
-        help=(
-            "Email address to provide to the Crossref web API so as to be "
-            + "able to use the polite pool."
-        ),
-    )
+        update_parser.add_argument(
+            "--db-dir",
+            required=True,
+            help="Path to the directory containing the LMDB database files.",
+        )
 
-    update_parser.add_argument(
-        "--from-date",
-        required=False,
-        help=(
-            "A date from which to search for updated records, specified in "
-            "`YYYY[-MM[-DD]]` format (i.e., month and day are optional)."
-        ),
-    )
+        update_parser.add_argument(
+            "--email-address",
+            type=str,
+            required=True,
+            help=(
+                "Email address to provide to the Crossref web API so as to be "
+                + "able to use the polite pool."
+            ),
+        )
 
-    update_parser.add_argument(
-        "--filter-arg",
-        required=False,
-        help="A Crossref web API filter string for restricting DOIs.",
-    )
+        update_parser.add_argument(
+            "--from-date",
+            required=False,
+            help=(
+                "A date from which to search for updated records, specified in "
+                "`YYYY[-MM[-DD]]` format (i.e., month and day are optional)."
+            ),
+        )
+
+        update_parser.add_argument(
+            "--filter-arg",
+            required=False,
+            help="A Crossref web API filter string for restricting DOIs.",
+        )
 
     return parser
 
@@ -188,6 +245,11 @@ def run(args: argparse.Namespace) -> None:
 
     LOGGER.debug(f"Running command with arguments: {args}")
 
+    # deferred so that simple invocations (`--help`, errors) don't pay the
+    # cost of loading the lmdb and simdjson extension modules
+    import crossref_lmdb.main
+    import crossref_lmdb.params
+
     action_args: crossref_lmdb.params.CreateParams | crossref_lmdb.params.UpdateParams
 
     if args.command == "create":
@@ -201,6 +263,7 @@ def run(args: argparse.Namespace) -> None:
             filter_path=args.filter_path,
             show_progress=args.show_progress,
             start_from_file_num=args.start_from_file_num,
+            assume_sorted=args.assume_sorted,
         )
 
     elif args.command == "update":
@@ -15,25 +15,40 @@ LOGGER = logging.getLogger("crossref_lmdb")
 
 def get_indexed_datetime(item: simdjson.Object) -> datetime.datetime | None:
 
-    try:
-        item_indexed = item["indexed"]
-    except KeyError:
+    item_datetime_str = get_indexed_datetime_str(item=item)
+
+    if item_datetime_str is None:
         return None
 
-    if not isinstance(item_indexed, simdjson.Object):
-        raise ValueError()
+    indexed_datetime = parse_indexed_datetime(indexed_datetime=item_datetime_str)
+
+    return indexed_datetime
+
+
+def get_indexed_datetime_str(item: simdjson.Object) -> str | None:
 
     try:
-        item_datetime_str = item_indexed["date-time"]
+        # a single pointer lookup avoids materialising the intermediate
+        # "indexed" object
+        item_datetime_str = item.at_pointer("/indexed/date-time")
     except KeyError:
+        # the pointer lookup cannot tell a missing key (routine; the
+        # item just has no indexed date) from "indexed" being present
+        # but a scalar (malformed), so disambiguate with a second probe
+        try:
+            indexed = item["indexed"]
+        except KeyError:
+            return None
+        if not isinstance(indexed, simdjson.Object):
+            raise ValueError() from None
         return None
+    except TypeError as err:
+        raise ValueError() from err
 
     if not isinstance(item_datetime_str, str):
         raise ValueError()
 
-    indexed_datetime = parse_indexed_datetime(indexed_datetime=item_datetime_str)
-
-    return indexed_datetime
+    return item_datetime_str
 
 
 def parse_indexed_datetime(indexed_datetime: str) -> datetime.datetime:
@@ -42,6 +57,22 @@ def parse_indexed_datetime(indexed_datetime: str) -> datetime.datetime:
         msg = f"Unexpected date format in `{indexed_datetime}`"
         raise ValueError(msg)
 
+    # the CrossRef indexed date is almost always exactly
+    # `YYYY-MM-DDTHH:MM:SSZ`, which can be picked apart by offset much
+    # faster than the general ISO parser can manage
+    if len(indexed_datetime) == 20:
+        try:
+            return datetime.datetime(
+                year=int(indexed_datetime[0:4]),
+                month=int(indexed_datetime[5:7]),
+                day=int(indexed_datetime[8:10]),
+                hour=int(indexed_datetime[11:13]),
+                minute=int(indexed_datetime[14:16]),
+                second=int(indexed_datetime[17:19]),
+            )
+        except ValueError:
+            pass
+
     return datetime.datetime.fromisoformat(indexed_datetime[:-1])
 
 
@@ -68,25 +99,34 @@ def get_published_date(item: simdjson.Object) -> datetime.date | None:
     if not isinstance(date_parts, simdjson.Array):
         raise ValueError(json_msg)
 
-    dates: list[datetime.date] = []
+    # a rolling maximum over (year, month, day) tuples, which compare the
+    # same as the dates they describe, defers constructing a `datetime.date`
+    # until the end
+    best: tuple[int, int, int] | None = None
 
     for raw_date_parts in date_parts:
 
         if not isinstance(raw_date_parts, simdjson.Array):
             raise ValueError(json_msg)
 
-        if len(raw_date_parts) == 1:
-            (year,) = typing.cast(tuple[int], raw_date_parts)
-            month = day = 1
-        elif len(raw_date_parts) == 2:
-            (year, month) = typing.cast(tuple[int, int], raw_date_parts)
-            day = 1
-        elif len(raw_date_parts) == 3:
-            (year, month, day) = typing.cast(tuple[int, int, int], raw_date_parts)
-        else:
+        n_parts = len(raw_date_parts)
+
+        if not (1 <= n_parts <= 3):
             msg = f"Unknown date format: {raw_date_parts}"
             raise ValueError(msg)
 
-        dates.append(datetime.date(year=year, month=month, day=day))
+        candidate = (
+            typing.cast(int, raw_date_parts[0]),
+            typing.cast(int, raw_date_parts[1]) if n_parts >= 2 else 1,
+            typing.cast(int, raw_date_parts[2]) if n_parts == 3 else 1,
+        )
+
+        if best is None or candidate > best:
+            best = candidate
+
+    if best is None:
+        raise ValueError(json_msg)
+
+    (year, month, day) = best
 
-    return max(dates)
+    return datetime.date(year=year, month=month, day=day)
@@ -14,6 +14,34 @@ import lmdb
 
 import simdjson
 
+if typing.TYPE_CHECKING:
+    import zstandard
+
+try:
+    # a SIMD-accelerated, zlib-compatible drop-in from the `speed` extra
+    from isal import isal_zlib
+
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
+_zlib_decompress: typing.Callable[[bytes], bytes]
+_zlib_error: type[Exception]
+
+if HAS_ISAL:
+    _zlib_decompress = isal_zlib.decompress
+    # isal's stubs type `error` as an instance rather than the class
+    _zlib_error = typing.cast("type[Exception]", isal_zlib.error)
+else:
+    _zlib_decompress = zlib.decompress
+    _zlib_error = zlib.error
+
+
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# where a trained zstd compression dictionary is stored, when in use
+ZSTD_DICT_KEY = b"__zstd_dict"
+
 
 class DBReader(collections.abc.Mapping[str, simdjson.Object]):
 
@@ -33,7 +61,10 @@ class DBReader(collections.abc.Mapping[str, simdjson.Object]):
 
         self._db_dir = db_dir
 
-        self._special_keys = ("__most_recent_indexed",)
+        self._special_keys = ("__most_recent_indexed", ZSTD_DICT_KEY.decode())
+
+        # created lazily on the first zstd-compressed value
+        self._zstd_decompressor: zstandard.ZstdDecompressor | None = None
 
         self._env = lmdb.Environment(
             path=str(self._db_dir),
@@ -69,16 +100,26 @@ class DBReader(collections.abc.Mapping[str, simdjson.Object]):
 
         n_total_entries: int = self._env.stat()["entries"]  # type: ignore[union-attr]
 
-        return n_total_entries - len(self._special_keys)
+        n_special_present = sum(
+            self._txn.get(special_key.encode()) is not None
+            for special_key in self._special_keys
+        )
+
+        return n_total_entries - n_special_present
 
     def __getitem__(self, key: object) -> simdjson.Object:
 
-        if str(key).startswith("__"):
-            raise KeyError()
+        # bulk lookups often already hold bytes keys; those skip the
+        # str round-trip (DOIs are ASCII either way)
+        if isinstance(key, bytes | bytearray | memoryview):
+            key_bytes = bytes(key)
+        else:
+            key_bytes = str(key).encode()
 
-        key_str = str(key)
+        if key_bytes.startswith(b"__"):
+            raise KeyError()
 
-        raw_item = self._txn.get(key_str.encode())
+        raw_item = self._txn.get(key_bytes)
 
         raw_data = self._extract_value(raw_value=raw_item)
 
@@ -93,34 +134,82 @@ class DBReader(collections.abc.Mapping[str, simdjson.Object]):
 
     def __iter__(self) -> typing.Iterator[str]:
 
-        self._has_more = self._cursor.first()
+        return self._iter_keys()
 
-        return self
+    def _iter_keys(self) -> typing.Iterator[str]:
+
+        if not self._cursor.first():
+            return
 
-    def __next__(self) -> str:
+        # the cursor's iterator yields keys in a tight C loop
+        for raw_key in self._cursor.iternext(keys=True, values=False):
 
-        key: str | None = None
+            key_bytes = bytes(raw_key)
 
-        while key is None or key in self._special_keys:
+            # the special metadata keys all carry a "__" prefix, which a
+            # DOI cannot, so a two-byte test replaces the tuple lookup and
+            # the special keys are never decoded at all
+            if key_bytes.startswith(b"__"):
+                continue
 
-            if hasattr(self, "_has_more") and not self._has_more:
-                raise StopIteration()
+            yield key_bytes.decode()
 
-            key = bytes(self._cursor.key()).decode()
+    def _extract_value(self, raw_value: bytes) -> bytes:
 
-            self._has_more = self._cursor.next()
+        # values written with the optional zstd support start with the zstd
+        # frame magic; anything else is zlib or stored raw
+        if bytes(raw_value[:4]) == ZSTD_FRAME_MAGIC:
+            value: bytes = self._get_zstd_decompressor().decompress(
+                bytes(raw_value)
+            )
+            return value
 
-        return key
+        # a zlib stream has deflate (8) in the low nibble of its first byte
+        # and a big-endian header divisible by 31, so compressed and raw
+        # values can be told apart without paying for an exception per read
+        header = bytes(raw_value[:2])
 
-    @staticmethod
-    def _extract_value(raw_value: bytes) -> bytes:
+        if (
+            len(header) == 2
+            and (header[0] & 0x0F) == 8
+            and int.from_bytes(header, "big") % 31 == 0
+        ):
+            try:
+                return _zlib_decompress(raw_value)
+            except _zlib_error:
+                # raw value that happened to look like a zlib header
+                pass
+
+        return bytes(raw_value)
+
+    def _get_zstd_decompressor(self) -> zstandard.ZstdDecompressor:
+
+        if self._zstd_decompressor is not None:
+            return self._zstd_decompressor
 
         try:
-            value = zlib.decompress(raw_value)
-        except zlib.error:
-            value = bytes(raw_value)
+            import zstandard
+        except ImportError as err:
+            msg = (
+                "This database was created with zstd compression; install "
+                + "the `zstd` extra (`pip install crossref-lmdb[zstd]`) to "
+                + "read it"
+            )
+            raise ValueError(msg) from err
+
+        raw_dict = self._txn.get(ZSTD_DICT_KEY)
+
+        # a decompressor with the dictionary loaded also handles frames
+        # that were written without it
+        self._zstd_decompressor = (
+            zstandard.ZstdDecompressor(
+                dict_data=zstandard.ZstdCompressionDict(bytes(raw_dict))
+            )
+            if raw_dict is not None
+            else zstandard.ZstdDecompressor()
+        )
 
-        return value
+        return self._zstd_decompressor
 
     @property
     def most_recent_indexed(self) -> str:
@@ -4,11 +4,27 @@ Interface for reading items from a file.
 
 from __future__ import annotations
 
+import concurrent.futures
+import os
 import pathlib
 import gzip
 import typing
 import logging
 
+try:
+    import rapidgzip
+
+    HAS_RAPIDGZIP = True
+except ImportError:
+    HAS_RAPIDGZIP = False
+
+try:
+    from isal import igzip
+
+    HAS_IGZIP = True
+except ImportError:
+    HAS_IGZIP = False
+
 import crossref_lmdb.items
 import crossref_lmdb.filt
 
@@ -31,10 +47,18 @@ class FileSource(crossref_lmdb.items.ItemSource):
         self._show_progress = show_progress
         self._filter_func = filter_func
 
-        self.gz_paths = sorted(
-            self.public_data_dir.glob("*.json.gz"),
-            key=self.file_num_from_path,
-        )
+        # a single scandir pass is cheaper than pathlib's glob, which
+        # pattern-matches and stats each entry; numbering each file once
+        # into a dict serves both the sort and the start-from filter
+        self._file_nums = {
+            pathlib.Path(entry.path): self.file_num_from_path(
+                path=pathlib.Path(entry.path)
+            )
+            for entry in os.scandir(self.public_data_dir)
+            if entry.name.endswith(".json.gz")
+        }
+
+        self.gz_paths = sorted(self._file_nums, key=self._file_nums.__getitem__)
 
     @property
     def total_items(self) -> int:
@@ -56,19 +80,58 @@ class FileSource(crossref_lmdb.items.ItemSource):
     def file_num_from_path(path: pathlib.Path) -> int:
         return int(path.name[: -len(".json.gz")])
 
+    @staticmethod
+    def read_items_data(gz_path: pathlib.Path) -> bytes:
+
+        # the `speed` extra provides faster DEFLATE implementations:
+        # rapidgzip decompresses a single file across cores and isal uses
+        # SIMD-accelerated inflate; otherwise fall back to stdlib gzip
+        if HAS_RAPIDGZIP:
+            with rapidgzip.open(
+                str(gz_path),
+                parallelization=os.cpu_count() or 1,
+            ) as handle:
+                return typing.cast(bytes, handle.read())
+
+        # decompress in one shot rather than via a GzipFile read loop;
+        # simdjson needs the complete document anyway
+        if HAS_IGZIP:
+            return typing.cast(bytes, igzip.decompress(gz_path.read_bytes()))
+
+        return gzip.decompress(gz_path.read_bytes())
+
     def iter_unfiltered_items_data(self) -> typing.Iterable[bytes]:
 
         LOGGER.info(f"Starting from file with number: {self.start_from_file_num}")
 
-        for gz_path in self.gz_paths:
+        gz_paths = [
+            gz_path
+            for gz_path in self.gz_paths
+            if self._file_nums[gz_path] >= self.start_from_file_num
+        ]
+
+        # a single worker thread reads and decompresses the next file while
+        # the caller is still parsing and inserting the current one (zlib
+        # releases the GIL during decompression)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+
+            future: concurrent.futures.Future[bytes] | None = (
+                executor.submit(self.read_items_data, gz_paths[0])
+                if gz_paths
+                else None
+            )
 
-            file_num = self.file_num_from_path(gz_path)
+            for file_counter in range(len(gz_paths)):
 
-            if file_num < self.start_from_file_num:
-                continue
+                if future is None:
+                    raise ValueError()
 
-            with gzip.open(gz_path, "rb") as handle:
+                data = future.result()
 
-                data = handle.read()
+                future = (
+                    executor.submit(self.read_items_data, gz_paths[file_counter + 1])
+                    if (file_counter + 1) < len(gz_paths)
+                    else None
+                )
 
                 yield data
@@ -4,19 +4,44 @@ Handles the loading of a filtering function from a file.
 
 from __future__ import annotations
 
+import ast
+import functools
 import typing
 import pathlib
 
-import simdjson
+if typing.TYPE_CHECKING:
+    import simdjson
 
 
-FilterFunc: typing.TypeAlias = typing.Callable[[simdjson.Object], bool]
+FilterFunc: typing.TypeAlias = "typing.Callable[[simdjson.Object], bool]"
 
 
 def get_filter_func(filter_path: pathlib.Path) -> FilterFunc:
 
+    # cached on the modification time so that repeated loads of the same
+    # filter file don't re-read and re-exec its code
+    return _load_filter_func(
+        filter_path=filter_path,
+        mtime_ns=filter_path.stat().st_mtime_ns,
+    )
+
+
+@functools.cache
+def _load_filter_func(
+    filter_path: pathlib.Path,
+    mtime_ns: int,  # noqa: ARG001
+) -> FilterFunc:
+
     filter_code = filter_path.read_text()
 
+    # filters of the common shape `return item["key"] == value` can be
+    # swapped for a direct JSON pointer lookup, which skips running the
+    # user's Python per item
+    specialised_func = specialise_filter_func(code=filter_code)
+
+    if specialised_func is not None:
+        return specialised_func
+
     filter_locals = run_code_from_text(code=filter_code)
 
     if "filter_func" not in filter_locals:
@@ -34,8 +59,147 @@ def run_code_from_text(
     code: str,
 ) -> dict[str, object]:
 
-    code_locals: dict[str, object] = {}
+    # a single dict serves as both globals and locals, so that functions
+    # defined in the file can see its other top-level names when called
+    # later (with separate dicts, those lookups go to the empty globals
+    # and fail)
+    code_scope: dict[str, object] = {}
+
+    exec(code, code_scope)
+
+    code_scope.pop("__builtins__", None)
+
+    return code_scope
+
+
+def specialise_filter_func(code: str) -> FilterFunc | None:
+    """
+    Try to convert a filter function of the shape
+    ``def filter_func(item): return item["a"]["b"] == value`` (or ``!=``,
+    or ``in`` / ``not in`` over a literal collection) into an equivalent
+    function built around a single ``at_pointer`` call.
+
+    Returns ``None`` if the code doesn't have that shape.
+    """
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+
+    func_def: ast.FunctionDef | None = None
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "filter_func":
+            func_def = node
+        elif not isinstance(node, ast.Import | ast.ImportFrom):
+            # other module-level code might set up state that the filter
+            # depends on, so it cannot be specialised away
+            return None
+
+    if func_def is None or func_def.decorator_list:
+        return None
+
+    func_args = func_def.args
+
+    if (
+        len(func_args.args) != 1
+        or func_args.posonlyargs
+        or func_args.kwonlyargs
+        or func_args.vararg is not None
+        or func_args.kwarg is not None
+    ):
+        return None
+
+    if len(func_def.body) != 1:
+        return None
+
+    (statement,) = func_def.body
+
+    if not isinstance(statement, ast.Return) or statement.value is None:
+        return None
+
+    comparison = statement.value
+
+    if not isinstance(comparison, ast.Compare) or len(comparison.ops) != 1:
+        return None
+
+    (compare_op,) = comparison.ops
+
+    (comparator,) = comparison.comparators
 
-    exec(code, {}, code_locals)
+    is_membership = isinstance(compare_op, ast.In | ast.NotIn)
 
-    return code_locals
+    if isinstance(compare_op, ast.Eq | ast.NotEq):
+
+        if not isinstance(comparator, ast.Constant):
+            return None
+
+        expected: object = comparator.value
+
+    elif is_membership:
+
+        # a literal collection of constants becomes a frozenset, so the
+        # membership test runs at C speed
+        if not isinstance(comparator, ast.Tuple | ast.List | ast.Set) or not all(
+            isinstance(element, ast.Constant) for element in comparator.elts
+        ):
+            return None
+
+        expected = frozenset(
+            typing.cast(ast.Constant, element).value
+            for element in comparator.elts
+        )
+
+    else:
+        return None
+
+    # walk the `item["a"]["b"]` subscript chain back to the parameter
+    pointer_parts: list[str] = []
+
+    subscript: ast.expr = comparison.left
+
+    while isinstance(subscript, ast.Subscript):
+
+        subscript_slice = subscript.slice
+
+        if not (
+            isinstance(subscript_slice, ast.Constant)
+            and isinstance(subscript_slice.value, str)
+        ):
+            return None
+
+        pointer_parts.append(subscript_slice.value)
+
+        subscript = subscript.value
+
+    if (
+        not pointer_parts
+        or not isinstance(subscript, ast.Name)
+        or subscript.id != func_args.args[0].arg
+    ):
+        return None
+
+    # "~" and "/" are special within a JSON pointer token and need their
+    # RFC 6901 escapes, or a key like "a/b" would be read as two levels
+    pointer = "".join(
+        "/" + part.replace("~", "~0").replace("/", "~1")
+        for part in reversed(pointer_parts)
+    )
+
+    is_positive = isinstance(compare_op, ast.Eq | ast.In)
+
+    if is_membership:
+
+        members = typing.cast("frozenset[object]", expected)
+
+        def filter_func(item: simdjson.Object) -> bool:
+            # missing keys raise KeyError, as the subscripts would have
+            return bool((item.at_pointer(pointer) in members) == is_positive)
+
+    else:
+
+        def filter_func(item: simdjson.Object) -> bool:
+            return bool((item.at_pointer(pointer) == expected) == is_positive)
+
+    return filter_func
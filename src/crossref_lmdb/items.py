@@ -11,8 +11,6 @@ import collections
 
 import simdjson
 
-import alive_progress
-
 import crossref_lmdb.filt
 
 
@@ -50,17 +48,29 @@ class ItemSource(abc.ABC, collections.abc.Iterator[Item]):
     @abc.abstractmethod
     def iter_unfiltered_items_data(self) -> typing.Iterable[bytes]: ...
 
+    def prepare_items(self, data: bytes) -> simdjson.Array:
+        # sources whose data wraps the items deeper than a top-level
+        # "items" key override this to point at them directly
+        return prepare_json_items(data=data)
+
     def iter_item(self) -> typing.Iterator[Item]:
 
+        # deferred because it is only needed once items are being iterated
+        import alive_progress
+
         with alive_progress.alive_bar(
             total=self.total_items,
             disable=not self.show_progress,
             unit=f" {self.total_units}",
         ) as progress_bar:
 
+            # bound to a local once; the property lookup (and any filter
+            # loading behind it) stays out of the per-item loop
+            filter_func = self.filter_func
+
             for data in self.iter_unfiltered_items_data():
 
-                json_items = prepare_json_items(data=data)
+                json_items = self.prepare_items(data=data)
 
                 for item in json_items:
 
@@ -68,15 +78,27 @@ class ItemSource(abc.ABC, collections.abc.Iterator[Item]):
                         LOGGER.error("Invalid JSON")
                         raise ValueError("Invalid JSON")
 
-                    if item.get("DOI", None) is None:
-                        item_bytes = typing.cast(bytes, item.mini)
-                        LOGGER.debug(
-                            f"Item {item_bytes.decode()} does not have a DOI; skipping"
-                        )
-
-                    elif self.filter_func is not None and not self.filter_func(item):
-                        item_bytes = typing.cast(bytes, item.mini)
-                        LOGGER.debug(f"Filtered out item {item_bytes.decode()}")
+                    try:
+                        # a plain subscript is the cheapest presence probe
+                        # the binding offers; .get goes through a
+                        # Python-level wrapper
+                        doi_missing = item["DOI"] is None
+                    except KeyError:
+                        doi_missing = True
+
+                    if doi_missing:
+                        # only re-serialise the item if the message will show
+                        if LOGGER.isEnabledFor(logging.DEBUG):
+                            item_bytes = typing.cast(bytes, item.mini)
+                            LOGGER.debug(
+                                f"Item {item_bytes.decode()} does not have a DOI; "
+                                + "skipping"
+                            )
+
+                    elif filter_func is not None and not filter_func(item):
+                        if LOGGER.isEnabledFor(logging.DEBUG):
+                            item_bytes = typing.cast(bytes, item.mini)
+                            LOGGER.debug(f"Filtered out item {item_bytes.decode()}")
 
                     else:
                         yield item
@@ -84,7 +106,7 @@ class ItemSource(abc.ABC, collections.abc.Iterator[Item]):
                 progress_bar()
 
 
-def prepare_json_items(data: bytes) -> simdjson.Array:
+def prepare_json_items(data: bytes, pointer: str = "/items") -> simdjson.Array:
 
     json_error_msg = "Invalid JSON"
 
@@ -95,7 +117,7 @@ def prepare_json_items(data: bytes) -> simdjson.Array:
     if not isinstance(json_data, simdjson.Object):
         raise ValueError(json_error_msg)
 
-    json_items = json_data["items"]
+    json_items = json_data.at_pointer(pointer)
     if not isinstance(json_items, simdjson.Array):
         raise ValueError(json_error_msg)
 
@@ -5,8 +5,11 @@ Interface for creating and updating the database.
 from __future__ import annotations
 
 import typing
+import concurrent.futures
 import datetime
 import logging
+import operator
+import os
 import zlib
 import types
 
@@ -16,6 +19,20 @@ import simdjson
 
 import tenacity
 
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    from isal import isal_zlib
+
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
 import crossref_lmdb.params
 import crossref_lmdb.web
 import crossref_lmdb.file
@@ -26,6 +43,20 @@ import crossref_lmdb.date
 
 LOGGER = logging.getLogger("crossref_lmdb")
 
+# zstd's own default; used when the CLI default level (-1) is requested
+ZSTD_DEFAULT_LEVEL = 3
+
+# CrossRef items share most of their JSON vocabulary, so a dictionary
+# trained on an early sample of items compresses the rest much better
+ZSTD_DICT_SIZE_BYTES = 100_000
+ZSTD_DICT_N_SAMPLES = 10_000
+
+# commit cost scales with the dirty pages flushed rather than the item
+# count, so a window is also flushed once its pending bytes pass this
+# threshold, keeping each commit within a predictable memory budget even
+# when individual records are large
+COMMIT_MAX_PENDING_BYTES = 64 * 1024 * 1024
+
 
 def run(
     params: crossref_lmdb.params.CreateParams | crossref_lmdb.params.UpdateParams,
@@ -50,11 +81,20 @@ def run(
         LOGGER.info("No most-recently indexed item found in the database")
         pass
 
+    is_bulk_create = isinstance(params, crossref_lmdb.params.CreateParams)
+
     with lmdb.Environment(
         path=str(params.db_dir),
         readonly=False,
         map_size=params.max_db_size_bytes,
         subdir=True,
+        # when bulk-loading from the public data, skip the per-commit
+        # fsyncs and write through the map; durability is restored by the
+        # explicit sync once the load has finished
+        writemap=is_bulk_create,
+        map_async=is_bulk_create,
+        sync=not is_bulk_create,
+        metasync=not is_bulk_create,
     ) as env:
 
         # we acquire items either from a file (create) or via the web API (update)
@@ -82,10 +122,21 @@ def run(
             commit_frequency=params.commit_frequency,
             compression_level=params.compression_level,
             most_recent_indexed=most_recent_indexed,
+            append=(
+                isinstance(params, crossref_lmdb.params.CreateParams)
+                and params.assume_sorted
+            ),
         ) as item_inserter:
 
+            # binding the method once keeps the attribute lookup out of
+            # the per-item loop
+            insert_item = item_inserter.insert_item
+
             for item in item_iterator:
-                item_inserter.insert_item(item=item)
+                insert_item(item=item)
+
+        if is_bulk_create:
+            env.sync(True)
 
     end_time = datetime.datetime.now()
 
@@ -106,16 +157,152 @@ class Inserter:
         commit_frequency: int,
         compression_level: int,
         most_recent_indexed: datetime.datetime,
+        append: bool = False,
     ) -> None:
 
         self.env = env
         self.commit_frequency = commit_frequency
         self.compression_level = compression_level
-        self.most_recent_indexed = most_recent_indexed
 
-        self.txn: lmdb.Transaction | None = None
+        # only valid when DOIs arrive globally sorted across the whole run;
+        # lets LMDB skip the B-tree search on every insert
+        self.append = append
+
+        # tracked as an ISO string; the fixed-width format compares
+        # lexicographically the same as the datetimes it represents, which
+        # avoids parsing a datetime per item
+        self.most_recent_indexed = most_recent_indexed.isoformat()
+        self._most_recent_written = self.most_recent_indexed
+
+        self._pending: list[tuple[bytes, bytes]] = []
+
+        # in append mode the "__"-prefixed metadata keys are held back
+        # until the load has finished (see `commit`)
+        self._deferred_meta: dict[bytes, bytes] = {}
+
+        # item values awaiting compression; compressed in parallel when the
+        # commit window is flushed
+        self._pending_raw: list[tuple[bytes, bytes]] = []
+        self._pending_bytes = 0
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+
         self.item_count = 0
 
+        # prefer zstd when the optional dependency is installed; it is both
+        # faster and smaller than zlib on small JSON records, and its frames
+        # are self-identifying so `DBReader` can tell the two apart
+        self._zstd_level = (
+            ZSTD_DEFAULT_LEVEL
+            if self.compression_level == -1
+            else self.compression_level
+        )
+
+        self._zstd_compressor = (
+            zstandard.ZstdCompressor(level=self._zstd_level)
+            if HAS_ZSTD and self.compression_level != 0
+            else None
+        )
+
+        # items held back (as (key, value) pairs of raw bytes) until enough
+        # have been seen to train a compression dictionary
+        self._zstd_samples: list[tuple[bytes, bytes]] | None = None
+        self._zstd_dict: zstandard.ZstdCompressionDict | None = None
+
+        if self._zstd_compressor is not None:
+
+            existing_dict = self._read_existing_zstd_dict()
+
+            if existing_dict is not None:
+                self._zstd_dict = existing_dict
+                self._zstd_compressor = zstandard.ZstdCompressor(
+                    level=self._zstd_level,
+                    dict_data=existing_dict,
+                )
+            else:
+                self._zstd_samples = []
+
+        # copying an already-initialised compressor is cheaper than having
+        # `zlib.compress` set up a fresh deflate state for every item
+        self._compressor_template = (
+            zlib.compressobj(self.compression_level)
+            if not HAS_ZSTD and self.compression_level != 0
+            else None
+        )
+
+        # isal (from the `speed` extra) emits zlib-compatible streams much
+        # faster than stdlib zlib; its levels only span 0-3, so the
+        # requested zlib level is clamped
+        self._isal_level = (
+            2 if self.compression_level == -1 else min(self.compression_level, 3)
+        )
+
+        if not HAS_ZSTD and HAS_ISAL and self.compression_level > 3:
+            LOGGER.warning(
+                f"The requested compression level ({self.compression_level}) "
+                + "is above isal's maximum; compressing at level 3"
+            )
+
+    def _read_existing_zstd_dict(self) -> zstandard.ZstdCompressionDict | None:
+
+        # an update run on a database created with dictionary compression
+        # must keep using the stored dictionary
+        with self.env.begin(write=False) as txn:
+            raw_dict = txn.get(crossref_lmdb.db.ZSTD_DICT_KEY)
+
+        if raw_dict is None:
+            return None
+
+        return zstandard.ZstdCompressionDict(bytes(raw_dict))
+
+    def _train_zstd_dict(self) -> None:
+
+        if not self._zstd_samples:
+            self._zstd_samples = None
+            return
+
+        samples = [item_bytes for (_, item_bytes) in self._zstd_samples]
+
+        try:
+            zstd_dict = zstandard.train_dictionary(
+                ZSTD_DICT_SIZE_BYTES,
+                samples,
+            )
+        except zstandard.ZstdError as err:
+            # not enough (or not varied enough) data to train on; carry on
+            # with plain zstd frames
+            LOGGER.info(f"Not using a compression dictionary ({err})")
+        else:
+            self._zstd_dict = zstd_dict
+            self._zstd_compressor = zstandard.ZstdCompressor(
+                level=self._zstd_level,
+                dict_data=zstd_dict,
+            )
+            # stored raw so that readers can load it directly
+            self.insert(key=crossref_lmdb.db.ZSTD_DICT_KEY, value=zstd_dict.as_bytes())
+
+        held_back = self._zstd_samples
+        self._zstd_samples = None
+
+        for key, item_bytes in held_back:
+            self.insert_raw(key=key, value=item_bytes)
+
+    def compress(self, data: bytes) -> bytes:
+
+        if self._zstd_compressor is not None:
+            return self._zstd_compressor.compress(data)
+
+        # at level 0 the data is stored as-is; `DBReader` falls back to the
+        # raw value when it isn't a zlib stream
+        if self._compressor_template is None:
+            return data
+
+        if HAS_ISAL:
+            return isal_zlib.compress(data, self._isal_level)
+
+        compressor = self._compressor_template.copy()
+
+        return compressor.compress(data) + compressor.flush()
+
     def __enter__(self) -> Inserter:
         return self
 
@@ -126,51 +313,62 @@ class Inserter:
         exc_tb: types.TracebackType | None,
     ) -> None:
 
-        if self.txn is not None:
-            self.commit()
+        if self._zstd_samples is not None:
+            self._train_zstd_dict()
 
-    def insert_item(self, item: simdjson.Object) -> None:
+        self.commit()
 
-        item_bytes = typing.cast(bytes, item.mini)
+        self._write_deferred_meta()
+
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def insert_item(self, item: simdjson.Object) -> None:
 
         try:
-            doi = str(item["DOI"])
-        except KeyError:
+            # pointer lookup avoids materialising the item's other keys
+            doi = str(item.at_pointer("/DOI"))
+        except (KeyError, ValueError):
+            item_bytes = typing.cast(bytes, item.mini)
             LOGGER.warning(f"No DOI found in item {item_bytes.decode()}")
             return
 
-        LOGGER.debug(f"Inserting item with doi {doi}")
+        item_bytes = typing.cast(bytes, item.mini)
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Inserting item with doi {doi}")
 
         doi_bytes = doi.encode()
 
-        item_compressed = zlib.compress(
-            item_bytes,
-            level=self.compression_level,
-        )
+        if self._zstd_samples is not None:
 
-        self.insert(
-            key=doi_bytes,
-            value=item_compressed,
-        )
+            self._zstd_samples.append((doi_bytes, item_bytes))
 
-        indexed_datetime = crossref_lmdb.date.get_indexed_datetime(item=item)
+            if len(self._zstd_samples) >= ZSTD_DICT_N_SAMPLES:
+                self._train_zstd_dict()
 
-        if indexed_datetime is None:
-            LOGGER.warning(f"No indexed date for DOI {doi}")
+        else:
+            self.insert_raw(
+                key=doi_bytes,
+                value=item_bytes,
+            )
 
-        elif indexed_datetime > self.most_recent_indexed:
+        indexed_str = crossref_lmdb.date.get_indexed_datetime_str(item=item)
 
-            most_recent_indexed_str = indexed_datetime.isoformat()
+        if indexed_str is None:
+            LOGGER.warning(f"No indexed date for DOI {doi}")
+            return
 
-            self.insert(
-                key=b"__most_recent_indexed",
-                value=zlib.compress(
-                    most_recent_indexed_str.encode(),
-                    level=self.compression_level,
-                ),
-            )
+        if not indexed_str.endswith("Z"):
+            msg = f"Unexpected date format in `{indexed_str}`"
+            raise ValueError(msg)
 
-            self.most_recent_indexed = indexed_datetime
+        indexed_str = indexed_str[:-1]
+
+        if indexed_str > self.most_recent_indexed:
+            # only tracked in memory here; the sentinel key is written once
+            # per commit window rather than on every item that advances it
+            self.most_recent_indexed = indexed_str
 
     def insert(
         self,
@@ -178,22 +376,97 @@ class Inserter:
         value: bytes,
     ) -> None:
 
-        if self.txn is None:
-            self.init_txn()
+        self._pending.append((key, value))
 
-        if self.txn is None:
-            raise ValueError()
+        self.item_count += 1
+        self._pending_bytes += len(key) + len(value)
 
-        self.txn.put(
-            key=key,
-            value=value,
-        )
+        self._commit_if_window_full()
+
+    def insert_raw(
+        self,
+        key: bytes,
+        value: bytes,
+    ) -> None:
+
+        self._pending_raw.append((key, value))
 
         self.item_count += 1
+        self._pending_bytes += len(key) + len(value)
 
-        if self.item_count % self.commit_frequency == 0:
+        self._commit_if_window_full()
+
+    def _commit_if_window_full(self) -> None:
+
+        if (
+            (len(self._pending) + len(self._pending_raw)) >= self.commit_frequency
+            or self._pending_bytes >= COMMIT_MAX_PENDING_BYTES
+        ):
             self.commit()
-            self.txn = None
+
+    def _compress_batch(
+        self,
+        pairs: list[tuple[bytes, bytes]],
+    ) -> list[tuple[bytes, bytes]]:
+
+        if self._zstd_compressor is not None:
+            # compressor instances aren't thread safe, so each batch gets
+            # its own
+            compressor = (
+                zstandard.ZstdCompressor(
+                    level=self._zstd_level,
+                    dict_data=self._zstd_dict,
+                )
+                if self._zstd_dict is not None
+                else zstandard.ZstdCompressor(level=self._zstd_level)
+            )
+            return [(key, compressor.compress(value)) for (key, value) in pairs]
+
+        return [(key, self.compress(data=value)) for (key, value) in pairs]
+
+    def _compress_pending_raw(self) -> None:
+
+        if not self._pending_raw:
+            return
+
+        pending_raw = self._pending_raw
+        self._pending_raw = []
+
+        # the compressors release the GIL, so batches of items can be
+        # compressed on worker threads while others run concurrently
+        n_workers = max(1, (os.cpu_count() or 2) - 1)
+
+        if self.compression_level == 0 or n_workers == 1 or len(pending_raw) < 512:
+            self._pending.extend(self._compress_batch(pairs=pending_raw))
+            return
+
+        if self._zstd_compressor is not None:
+            # compresses the whole window in one C call, fanning out over
+            # zstd's own worker threads
+            compressed = self._zstd_compressor.multi_compress_to_buffer(
+                [value for (_, value) in pending_raw],
+                threads=n_workers,
+            )
+            self._pending.extend(
+                (key, compressed[pair_num].tobytes())
+                for pair_num, (key, _) in enumerate(pending_raw)
+            )
+            return
+
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=n_workers,
+            )
+
+        batch_size = -(-len(pending_raw) // n_workers)
+
+        batches = [
+            pending_raw[batch_start : (batch_start + batch_size)]
+            for batch_start in range(0, len(pending_raw), batch_size)
+        ]
+
+        for compressed_batch in self._pool.map(self._compress_batch, batches):
+            self._pending.extend(compressed_batch)
 
     @tenacity.retry(
         wait=tenacity.wait_exponential(multiplier=1, min=4, max=10),
@@ -202,12 +475,74 @@ class Inserter:
         after=tenacity.after_log(logger=LOGGER, log_level=logging.WARNING),
     )
     def commit(self) -> None:
-        if self.txn is None:
-            raise ValueError()
-        self.txn.commit()
 
-    def init_txn(self) -> None:
-        self.txn = self.env.begin(write=True)
+        self._compress_pending_raw()
+
+        # a 19-byte ISO timestamp only grows under compression, so the
+        # sentinel is stored as-is
+        if self.most_recent_indexed != self._most_recent_written:
+            self._pending.append(
+                (b"__most_recent_indexed", self.most_recent_indexed.encode())
+            )
+            self._most_recent_written = self.most_recent_indexed
+
+        if self.append:
+            # the "__"-prefixed metadata keys sort after the DOI keys, so
+            # writing one mid-load would leave the B-tree's last key above
+            # every DOI in the windows that follow and LMDB would reject
+            # their appends; the metadata is held back (later windows
+            # overwriting earlier values) and written once the final DOI
+            # window is in
+            self._deferred_meta.update(
+                pair for pair in self._pending if pair[0].startswith(b"__")
+            )
+            self._pending = [
+                pair for pair in self._pending if not pair[0].startswith(b"__")
+            ]
+
+        if not self._pending:
+            return
+
+        # inserting in key order keeps the B-tree writes sequential, which
+        # avoids most page splits during a bulk load
+        self._pending.sort(key=operator.itemgetter(0))
+
+        # buffers=True lets puts accept buffer-protocol values without an
+        # intermediate bytes copy
+        with self.env.begin(write=True, buffers=True) as txn:
+            with txn.cursor() as cursor:
+                if not self.append:
+                    cursor.putmulti(self._pending)
+                else:
+                    (consumed, added) = cursor.putmulti(
+                        self._pending,
+                        append=True,
+                    )
+
+                    # out-of-order keys are rejected rather than appended
+                    if added != consumed:
+                        msg = (
+                            f"{consumed - added} DOIs arrived out of order; "
+                            + "the data are not sorted, so the database "
+                            + "cannot be created in append mode"
+                        )
+                        raise ValueError(msg)
+
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    def _write_deferred_meta(self) -> None:
+
+        if not self._deferred_meta:
+            return
+
+        # an ordinary (non-append) transaction; by now the metadata keys
+        # sorting after the DOIs no longer matters
+        with self.env.begin(write=True) as txn:
+            for key, value in sorted(self._deferred_meta.items()):
+                txn.put(key, value)
+
+        self._deferred_meta.clear()
 
 
 def get_from_date(params: crossref_lmdb.params.UpdateParams) -> str:
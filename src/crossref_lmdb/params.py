@@ -6,7 +6,9 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import os
 import pathlib
+import stat
 import datetime
 
 import email_validator
@@ -14,6 +16,15 @@ import email_validator
 import crossref_lmdb.filt
 
 
+def _stat_or_none(path: pathlib.Path) -> os.stat_result | None:
+    # a single stat per path keeps validation to one syscall per check,
+    # which matters on network filesystems
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
 @dataclasses.dataclass
 class Params(abc.ABC):
     db_dir: pathlib.Path
@@ -22,7 +33,16 @@ class Params(abc.ABC):
     compression_level: int
     show_progress: bool
     commit_frequency: int
-    filter_func: crossref_lmdb.filt.FilterFunc | None = dataclasses.field(init=False)
+
+    @property
+    def filter_func(self) -> crossref_lmdb.filt.FilterFunc | None:
+
+        if self.filter_path is None:
+            return None
+
+        # loading execs the filter file, so it is deferred until the filter
+        # is actually needed (and cached across repeated access)
+        return crossref_lmdb.filt.get_filter_func(filter_path=self.filter_path)
 
     @property
     def max_db_size_bytes(self) -> int:
@@ -38,18 +58,16 @@ class Params(abc.ABC):
         return int(n_bytes)
 
     def __post_init__(self) -> None:
+        self._coerce_paths()
         self.validate()
-        self.set_filter_func()
 
-    def set_filter_func(self) -> None:
+    def _coerce_paths(self) -> None:
 
-        if self.filter_path is None:
-            self.filter_func = None
-            return None
+        # the CLI hands paths over as plain strings
+        self.db_dir = pathlib.Path(self.db_dir)
 
-        self.filter_func = crossref_lmdb.filt.get_filter_func(
-            filter_path=self.filter_path
-        )
+        if self.filter_path is not None:
+            self.filter_path = pathlib.Path(self.filter_path)
 
     def validate(self) -> None:
 
@@ -66,21 +84,23 @@ class Params(abc.ABC):
 
         errors: list[str] = []
 
-        if not self.db_dir.exists():
+        if _stat_or_none(self.db_dir) is None:
             errors.append(f"Database directory ({self.db_dir}) does not exist")
 
         if self.max_db_size_gb <= 0:
             errors.append(f"Invalid maximum database size ({self.max_db_size_gb})")
 
-        if self.compression_level not in list(range(-1, 9 + 1)):
+        if not (-1 <= self.compression_level <= 9):
             errors.append(f"Invalid compression level ({self.compression_level})")
 
         if self.filter_path is not None:
 
-            if not self.filter_path.exists():
+            filter_stat = _stat_or_none(self.filter_path)
+
+            if filter_stat is None:
                 errors.append(f"Filter path ({self.filter_path}) does not exist")
 
-            if self.filter_path.exists() and self.filter_path.suffix != ".py":
+            if filter_stat is not None and self.filter_path.suffix != ".py":
                 errors.append(
                     f"Filter path ({self.filter_path}) does not seem to be a Python "
                     + "source file (no .py extension)"
@@ -131,18 +151,27 @@ class UpdateParams(Params):
 class CreateParams(Params):
     public_data_dir: pathlib.Path
     start_from_file_num: int
+    assume_sorted: bool = False
+
+    def _coerce_paths(self) -> None:
+
+        super()._coerce_paths()
+
+        self.public_data_dir = pathlib.Path(self.public_data_dir)
 
     def _do_validation(self) -> list[str]:
 
         errors = super()._do_validation()
 
-        if not self.public_data_dir.exists() or not self.public_data_dir.is_dir():
+        public_data_stat = _stat_or_none(self.public_data_dir)
+
+        if public_data_stat is None or not stat.S_ISDIR(public_data_stat.st_mode):
             errors.append(
                 f"Public data directory ({self.public_data_dir}) does not exist "
                 + "or is not a directory"
             )
 
-        if not (self.public_data_dir / "0.json.gz").exists():
+        if _stat_or_none(self.public_data_dir / "0.json.gz") is None:
             errors.append(
                 f"Public data directory ({self.public_data_dir}) does contain the "
                 + "expected CrossRef data"
@@ -2,17 +2,20 @@
 Make web requests with rate limiting and retrying.
 """
 
+from __future__ import annotations
+
 import collections.abc
+import concurrent.futures
 import functools
 import logging
 import typing
-import math
 
 import requests
 import requests.utils
 import requests_ratelimiter
 import pyrate_limiter
 import retryhttp  # type: ignore[import-untyped]
+import tenacity
 
 import simdjson
 
@@ -30,6 +33,10 @@ DEFAULT_LIMITER = pyrate_limiter.Limiter(
     ),
 )
 
+# requests builds a full default-headers dict to answer this, so it is
+# looked up once at import rather than per user-agent read
+DEFAULT_REQUESTS_USER_AGENT = requests.utils.default_headers()["User-Agent"]
+
 
 class WebRequester:
 
@@ -72,7 +79,23 @@ class WebRequester:
 
         self.max_retry_attempts = max_retry_attempts
 
-        self.retry_wrapper = retryhttp.retry(max_attempt_number=self.max_retry_attempts)
+        # retryhttp already applies randomised ("full jitter") exponential
+        # waits to server errors and timeouts, which stops synchronised
+        # retry storms against the API; network errors default to an
+        # unjittered wait, so bring them into line
+        self.retry_wrapper = retryhttp.retry(
+            max_attempt_number=self.max_retry_attempts,
+            wait_network_errors=tenacity.wait_random_exponential(max=60),
+        )
+
+        # wrapped once here rather than per request; the decorator builds
+        # a new closure each time it is applied
+        self._retry_get = self.retry_wrapper(
+            functools.partial(
+                self._session.get,
+                timeout=60,
+            )
+        )
 
         if headers is not None:
             self._session.headers = {**self._session.headers, **headers}
@@ -91,13 +114,7 @@ class WebRequester:
             The request response.
         """
 
-        getter = functools.partial(
-            self._session.get,
-            timeout=60,
-        )
-
-        retry_get = self.retry_wrapper(getter)
-        response: requests.Response = retry_get(url=url)
+        response: requests.Response = self._retry_get(url=url)
 
         return response
 
@@ -120,7 +137,7 @@ class CrossRefWebAPI:
             headers={"User-Agent": self.user_agent},
         )
 
-    @property
+    @functools.cached_property
     def user_agent(self) -> str:
         """
         Value to send as the "User-Agent" header.
@@ -132,9 +149,7 @@ class CrossRefWebAPI:
             + f"; mailto:{self.email_address}"
         )
 
-        requests_ua = requests.utils.default_headers()["User-Agent"]
-
-        lib_name += f" {requests_ua}"
+        lib_name += f" {DEFAULT_REQUESTS_USER_AGENT}"
 
         return lib_name
 
@@ -271,65 +286,96 @@ class WebSource(crossref_lmdb.items.ItemSource):
 
         LOGGER.info(total_msg)
 
-        n_pages = math.ceil(total_results / self.n_rows)
+        # an integer ceiling; true division would round through a float,
+        # which cannot represent very large totals exactly
+        n_pages = -(total_results // -self.n_rows)
 
         return n_pages
 
     def iter_unfiltered_items_data(self) -> typing.Iterable[bytes]:
 
-        cursor = "*"
-
         more_pages = True
 
-        while more_pages:
+        # one parser is reused across pages, keeping its internal buffers
+        # allocated rather than rebuilding them per response
+        parser = simdjson.Parser()
+
+        # only the cursor varies between pages, so the fixed parts of the
+        # query are built once and concatenated around it; plain
+        # concatenation is immune to user-supplied filter arguments that
+        # happen to contain formatting characters
+        (query_prefix, query_suffix) = self._form_query_parts(
+            from_date=self.from_date,
+            filter_arg=self.filter_arg,
+            n_rows=self.n_rows,
+        )
 
-            query = self.form_query(
-                from_date=self.from_date,
-                filter_arg=self.filter_arg,
-                cursor=cursor,
-                n_rows=self.n_rows,
+        # the next page is requested on a worker thread as soon as its
+        # cursor is known, so the network round-trip overlaps with the
+        # caller parsing and inserting the current page
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+
+            future = executor.submit(
+                self.client.call,
+                query=query_prefix + "*" + query_suffix,
             )
 
-            LOGGER.debug("Querying CrossRef API")
-            response = self.client.call(query=query)
-            LOGGER.debug("Received response from CrossRef API")
+            while more_pages:
 
-            parser = simdjson.Parser()
+                LOGGER.debug("Querying CrossRef API")
+                response = future.result()
+                LOGGER.debug("Received response from CrossRef API")
 
-            data = parser.parse(response.content)
+                data = parser.parse(response.content)
 
-            if not isinstance(data, simdjson.Object):
-                raise ValueError()
+                if not isinstance(data, simdjson.Object):
+                    raise ValueError()
 
-            message = data["message"]
+                message = data["message"]
 
-            if not isinstance(message, simdjson.Object):
-                raise ValueError()
+                if not isinstance(message, simdjson.Object):
+                    raise ValueError()
 
-            message_bytes = typing.cast(
-                bytes,
-                message.mini,
-            )
+                items = message["items"]
 
-            LOGGER.debug("Yielding data")
+                if not isinstance(items, simdjson.Array):
+                    raise ValueError()
 
-            yield message_bytes
+                n_items = len(items)
 
-            items = message["items"]
+                LOGGER.debug(f"Number of items in this page: {n_items}")
 
-            if not isinstance(items, simdjson.Array):
-                raise ValueError()
+                more_pages = n_items > 0
 
-            n_items = len(items)
+                if more_pages:
+                    future = executor.submit(
+                        self.client.call,
+                        query=(
+                            query_prefix
+                            + str(message["next-cursor"])
+                            + query_suffix
+                        ),
+                    )
 
-            LOGGER.debug(f"Number of items in this page: {n_items}")
+                # the binding refuses to re-use a parser while proxies from
+                # its previous parse are alive, so they are dropped before
+                # the next page is parsed; the response bytes are yielded
+                # as-is, with `prepare_items` pointing at the items inside
+                # the "message" wrapper, rather than re-serialising the
+                # message into a standalone document
+                del data, message, items
 
-            more_pages = n_items > 0
+                LOGGER.debug("Yielding data")
 
-            if not more_pages:
-                break
+                yield response.content
 
-            cursor = str(message["next-cursor"])
+    def prepare_items(self, data: bytes) -> simdjson.Array:
+        # pages are yielded as raw API responses, so the items sit under
+        # the "message" wrapper
+        return crossref_lmdb.items.prepare_json_items(
+            data=data,
+            pointer="/message/items",
+        )
 
     @staticmethod
     def form_query(
@@ -341,16 +387,33 @@ class WebSource(crossref_lmdb.items.ItemSource):
         sort_results: bool = True,
     ) -> str:
 
-        query = "works?"
+        (prefix, suffix) = WebSource._form_query_parts(
+            from_date=from_date,
+            filter_arg=filter_arg,
+            n_rows=n_rows,
+            only_doi=only_doi,
+            sort_results=sort_results,
+        )
+
+        return prefix + cursor + suffix
+
+    @staticmethod
+    def _form_query_parts(
+        from_date: str,
+        filter_arg: str | None = None,
+        n_rows: int = 1_000,
+        only_doi: bool = False,
+        sort_results: bool = True,
+    ) -> tuple[str, str]:
+        # the query split either side of the cursor value, which is the
+        # only part that varies between pages
 
         filt = f"filter=from-index-date:{from_date}"
 
         if filter_arg is not None:
             filt += "," + filter_arg
 
-        rows = f"rows={n_rows}"
-
-        cursor = f"cursor={cursor}"
+        prefix = f"works?{filt}&rows={n_rows}&cursor="
 
         select = "select=DOI" if only_doi else None
 
@@ -358,10 +421,10 @@ class WebSource(crossref_lmdb.items.ItemSource):
 
         order: str | None = "order=asc" if sort_results else None
 
-        params = [
-            param
-            for param in (filt, rows, cursor, select, sort, order)
+        suffix = "".join(
+            f"&{param}"
+            for param in (select, sort, order)
             if param is not None
-        ]
+        )
 
-        return query + "&".join(params)
+        return (prefix, suffix)
@@ -0,0 +1,144 @@
+import datetime
+import gzip
+import json
+import os
+
+import pytest
+
+import lmdb
+
+import crossref_lmdb.params
+import crossref_lmdb.main
+import crossref_lmdb.db
+import crossref_lmdb
+
+
+def write_public_data(public_data_dir, n_files=2, n_items_per_file=3):
+
+    dois = []
+
+    for file_num in range(n_files):
+
+        items = [
+            {
+                "DOI": f"10.000{file_num + 1}/{item_num:04d}",
+                "indexed": {
+                    "date-time": f"2024-01-0{file_num + 1}T00:00:00Z",
+                },
+            }
+            for item_num in range(n_items_per_file)
+        ]
+
+        dois += [item["DOI"] for item in items]
+
+        data = json.dumps({"items": items}).encode()
+
+        (public_data_dir / f"{file_num}.json.gz").write_bytes(gzip.compress(data))
+
+    return dois
+
+
+def test_create_sorted(tmp_path):
+
+    public_data_dir = tmp_path / "data"
+    public_data_dir.mkdir()
+
+    db_dir = tmp_path / "db"
+    db_dir.mkdir()
+
+    dois = write_public_data(public_data_dir=public_data_dir)
+
+    max_db_size_gb = 1 if os.name == "nt" else 2000
+
+    params = crossref_lmdb.params.CreateParams(
+        public_data_dir=public_data_dir,
+        start_from_file_num=0,
+        db_dir=db_dir,
+        max_db_size_gb=max_db_size_gb,
+        filter_path=None,
+        compression_level=-1,
+        show_progress=False,
+        # smaller than the item count, so the load spans several commit
+        # windows; the metadata keys must not break the append ordering
+        # of the windows that follow them
+        commit_frequency=2,
+        assume_sorted=True,
+    )
+
+    crossref_lmdb.main.run(params=params)
+
+    with crossref_lmdb.DBReader(db_dir=db_dir) as reader:
+
+        assert len(reader) == len(dois)
+
+        assert list(reader) == dois
+
+        assert reader["10.0001/0000"]["DOI"] == "10.0001/0000"
+
+        assert reader.most_recent_indexed == "2024-01-02T00:00:00"
+
+
+def test_create_zstd_dictionary(tmp_path, monkeypatch):
+
+    pytest.importorskip("zstandard")
+
+    # few enough samples that the fixture data can train a dictionary
+    monkeypatch.setattr(crossref_lmdb.main, "ZSTD_DICT_N_SAMPLES", 8)
+
+    public_data_dir = tmp_path / "data"
+    public_data_dir.mkdir()
+
+    db_dir = tmp_path / "db"
+    db_dir.mkdir()
+
+    items = [
+        {
+            "DOI": f"10.0001/{item_num:04d}",
+            "title": f"An example title number {item_num ** 2}",
+            "indexed": {"date-time": "2024-01-01T00:00:00Z"},
+        }
+        for item_num in range(16)
+    ]
+
+    data = json.dumps({"items": items}).encode()
+
+    (public_data_dir / "0.json.gz").write_bytes(gzip.compress(data))
+
+    max_db_size_gb = 1 if os.name == "nt" else 2000
+
+    params = crossref_lmdb.params.CreateParams(
+        public_data_dir=public_data_dir,
+        start_from_file_num=0,
+        db_dir=db_dir,
+        max_db_size_gb=max_db_size_gb,
+        filter_path=None,
+        compression_level=-1,
+        show_progress=False,
+        commit_frequency=1_000,
+    )
+
+    crossref_lmdb.main.run(params=params)
+
+    with crossref_lmdb.DBReader(db_dir=db_dir) as reader:
+
+        assert len(reader) == len(items)
+
+        # items held back for training and items compressed with the
+        # trained dictionary must both read back intact
+        for item in items:
+            assert reader[item["DOI"]]["title"] == item["title"]
+
+    with lmdb.Environment(path=str(db_dir), readonly=False) as env:
+
+        # the trained dictionary was stored for readers
+        with env.begin(write=False) as txn:
+            assert txn.get(crossref_lmdb.db.ZSTD_DICT_KEY) is not None
+
+        # an updating inserter must pick up and reuse the stored dictionary
+        with crossref_lmdb.main.Inserter(
+            env=env,
+            commit_frequency=1_000,
+            compression_level=-1,
+            most_recent_indexed=datetime.datetime(year=1900, month=1, day=1),
+        ) as inserter:
+            assert inserter._zstd_dict is not None
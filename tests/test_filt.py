@@ -1,5 +1,9 @@
+import json
+
 import pytest
 
+import simdjson
+
 import crossref_lmdb.filt
 
 
@@ -34,3 +38,65 @@ a = 1
     result = crossref_lmdb.filt.run_code_from_text(code=code)
 
     assert result == {"a": 1}
+
+
+def test_specialise_filter_func():
+
+    code = """
+def filter_func(item):
+    return item["type"] == "journal-article"
+    """
+
+    filter_func = crossref_lmdb.filt.specialise_filter_func(code=code)
+
+    assert filter_func is not None
+
+    item = simdjson.Parser().parse(json.dumps({"type": "journal-article"}))
+
+    assert filter_func(item)
+
+    item = simdjson.Parser().parse(json.dumps({"type": "book"}))
+
+    assert not filter_func(item)
+
+    code = """
+def filter_func(item):
+    return len(item["type"]) == 2
+    """
+
+    assert crossref_lmdb.filt.specialise_filter_func(code=code) is None
+
+    code = """
+def filter_func(item):
+    return item["type"] in ("journal-article", "book")
+    """
+
+    filter_func = crossref_lmdb.filt.specialise_filter_func(code=code)
+
+    assert filter_func is not None
+
+    item = simdjson.Parser().parse(json.dumps({"type": "book"}))
+
+    assert filter_func(item)
+
+    item = simdjson.Parser().parse(json.dumps({"type": "dataset"}))
+
+    assert not filter_func(item)
+
+    # keys containing JSON-pointer special characters must be escaped
+    code = """
+def filter_func(item):
+    return item["a/b"]["c~d"] == 1
+    """
+
+    filter_func = crossref_lmdb.filt.specialise_filter_func(code=code)
+
+    assert filter_func is not None
+
+    item = simdjson.Parser().parse(json.dumps({"a/b": {"c~d": 1}}))
+
+    assert filter_func(item)
+
+    item = simdjson.Parser().parse(json.dumps({"a/b": {"c~d": 2}}))
+
+    assert not filter_func(item)